@@ -24,7 +24,6 @@
 
 import os
 import logging
-import re
 import time
 import subprocess
 import shutil
@@ -43,6 +42,7 @@ from container_ci_suite.utils import (
     get_os_environment,
     get_mount_options_from_s2i_args,
     get_env_commands_from_s2i_args,
+    check_envs_set as utils_check_envs_set,
     cwd,
 )
 from container_ci_suite.exceptions import ContainerCIException
@@ -364,9 +364,10 @@ class S2IContainerImage(object):
             logger.error("Container did not create cidfile.")
             return False
 
+        cid = self.get_cid_file(self.cid_file)
         try:
             jquery_output = PodmanCLIWrapper.run_docker_command(
-                f"exec {self.get_cid_file(self.cid_file)} "
+                f"exec {cid} "
                 f"/bin/bash -c "
                 f"'npm --verbose install jquery && test -f node_modules/jquery/src/jquery.js'"
             )
@@ -382,7 +383,7 @@ class S2IContainerImage(object):
 
         if self.cid_file.exists():
             PodmanCLIWrapper.run_docker_command(
-                f"stop {self.get_cid_file(self.cid_file)}"
+                f"stop {cid}"
             )
             self.cid_file.unlink()
         logger.info("Npm works.")
@@ -518,25 +519,6 @@ RUN which {binary} | grep {binary_path}
 
     # Replacement for ct_check_scl_enable_vars
     def test_check_envs_set(self, env_filter: str, check_envs: str, loop_envs: str, env_format="VALUE"):
-        fields_to_check: List = [
-            x for x in loop_envs.split('\n') if re.findall(env_filter, x) and not x.startswith("PWD=")
-        ]
-        for field in fields_to_check:
-            var_name, stripped = field.split('=', 2)
-            filtered_envs = [x for x in check_envs.split('\n') if x.startswith(f"{var_name}=")]
-            if not filtered_envs:
-                logger.error(f"{var_name} not found during 'docker exec'")
-                return False
-            filter_envs = ''.join(filtered_envs)
-            for value in stripped.split(':'):
-                # If the value checked does not go through env_filter we do not care about it
-                ret = re.findall(env_filter, value)
-                if not ret:
-                    continue
-                new_env = env_format.replace('VALUE', value)
-                find_env = re.findall(rf"{new_env}", filter_envs)
-                if not find_env:
-                    logger.error(f"Value {value} is missing from variable {var_name}")
-                    logger.error(filtered_envs)
-                    return False
-        return True
+        return utils_check_envs_set(
+            env_filter=env_filter, check_envs=check_envs, loop_envs=loop_envs, env_format=env_format
+        )
@@ -32,8 +32,9 @@ import requests
 import tempfile
 import yaml
 import contextlib
+import functools
 
-from typing import List, Any
+from typing import List, Any, Callable, Dict
 from pathlib import Path
 from datetime import datetime
 
@@ -42,6 +43,10 @@ from container_ci_suite.constants import CA_FILE_PATH
 
 logger = logging.getLogger(__name__)
 
+REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+# '.' matches itself as well, values without other metacharacters match their own text
+REGEX_METACHARS_NO_DOT = REGEX_METACHARS - {"."}
+
 
 def get_file_content(filename: Path) -> str:
     with open(str(filename)) as f:
@@ -105,6 +110,77 @@ def get_env_commands_from_s2i_args(s2i_args: str) -> List:
     return env_content
 
 
+@functools.lru_cache(maxsize=None)
+def get_env_filter_matcher(env_filter: Any) -> Callable[[str], Any]:
+    """
+    Return function which checks whether env_filter matches a string.
+    Filters made of plain alternatives, optionally anchored by '^', like
+    "^X_SCLS=|/opt/rh|/opt/app-root", are checked by str.startswith and 'in'
+    without the regular expression engine. Other filters are searched as regex.
+    """
+    if isinstance(env_filter, str):
+        prefixes: List = []
+        substrings: List = []
+        for alternative in env_filter.split("|"):
+            literal = alternative[1:] if alternative.startswith("^") else alternative
+            if any(char in REGEX_METACHARS for char in literal):
+                break
+            if alternative.startswith("^"):
+                prefixes.append(literal)
+            else:
+                substrings.append(literal)
+        else:
+            prefix_tuple = tuple(prefixes)
+            return lambda text: text.startswith(prefix_tuple) or any(x in text for x in substrings)
+    return re.compile(env_filter).search
+
+
+# Replacement for ct_check_scl_enable_vars
+def check_envs_set(env_filter: Any, check_envs: str, loop_envs: str, env_format: str = "VALUE") -> bool:
+    """
+    Check that variables from loop_envs that match env_filter are set in check_envs as well.
+    :param env_filter: str or compiled pattern, selects variables and values to check
+    :param check_envs: str, output of `env` command the values are searched in
+    :param loop_envs: str, output of `env` command the values are taken from
+    :param env_format: str, format of the value to search for, 'VALUE' is replaced by the value
+    :return: True if all values were found, False otherwise
+    """
+    env_filter_matches = get_env_filter_matcher(env_filter)
+    # Group check_envs lines by variable name once instead of scanning them for every field
+    check_env_lines: Dict[str, List[str]] = {}
+    for line in check_envs.split('\n'):
+        if '=' in line:
+            check_env_lines.setdefault(line.split('=', 1)[0], []).append(line)
+    fields_to_check: List = [
+        x for x in loop_envs.split('\n') if env_filter_matches(x) and not x.startswith("PWD=")
+    ]
+    # Entries set in check_envs can only be accepted without the pattern search for the default format
+    use_set = env_format == "VALUE"
+    for field in fields_to_check:
+        var_name, stripped = field.split('=', 1)
+        filtered_envs = check_env_lines.get(var_name)
+        if not filtered_envs:
+            logger.error(f"{var_name} not found during 'docker exec'")
+            return False
+        filter_envs = ''.join(filtered_envs)
+        if use_set:
+            check_values = {x for line in filtered_envs for x in line.split('=', 1)[1].split(':')}
+        for value in stripped.split(':'):
+            # If the value checked does not go through env_filter we do not care about it
+            if not env_filter_matches(value):
+                continue
+            # The same entry is set in check_envs, so the pattern below would match it
+            if use_set and value in check_values and not REGEX_METACHARS_NO_DOT.intersection(value):
+                continue
+            new_env = env_format.replace('VALUE', value)
+            find_env = re.findall(rf"{new_env}", filter_envs)
+            if not find_env:
+                logger.error(f"Value {value} is missing from variable {var_name}")
+                logger.error(filtered_envs)
+                return False
+    return True
+
+
 def get_public_image_name(os: str, base_image_name: str, version: str) -> str:
     registry = get_registry_name(os)
     if os == "rhel7":
@@ -20,28 +20,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import os
-import json
 import yaml
-from pathlib import Path
+import functools
 
 import pytest
 
-from tests.spellbook import DATA_DIR
-
+from flexmock import flexmock
 
-def create_ca_file():
-    CA_FILE_PATH = "/tmp/CA_FILE_PATH"
-    with open(CA_FILE_PATH, "w") as f:
-        f.write("foobar")
-    os.environ["NPM_REGISTRY"] = "foobar"
+from container_ci_suite import utils
+from tests.spellbook import DATA_DIR
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-def delete_ca_file():
-    CA_FILE_PATH = "/tmp/CA_FILE_PATH"
-    p = Path(CA_FILE_PATH)
-    p.unlink()
-    os.unsetenv("NPM_REGISTRY")
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 def s2i_build_as_df_fedora_test_app():
@@ -59,65 +56,72 @@ def s2i_build_as_df_fedora_test_app():
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_json(name):
+    return json_loads((DATA_DIR / name).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(name):
+    return yaml.load((DATA_DIR / name).read_bytes(), Loader=SafeLoader)
+
+
+def _read_first_line(name):
+    with open(DATA_DIR / name) as fd:
+        return fd.readline()
+
+
 @pytest.fixture
+def ca_file(monkeypatch):
+    monkeypatch.setenv("NPM_REGISTRY", "foobar")
+    flexmock(utils).should_receive("get_full_ca_file_path").and_return(flexmock(exists=lambda: True))
+
+
+@pytest.fixture(scope="session")
 def postgresql_json():
-    return json.loads((DATA_DIR / "postgresql_imagestreams.json").read_text())
+    return _load_json("postgresql_imagestreams.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def package_installation_json():
-    return json.loads((DATA_DIR / "postgresql_package_installation.json").read_text())
+    return _load_json("postgresql_package_installation.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helm_package_success():
-    with open(DATA_DIR / "helm_package_successful.txt") as fd:
-        lines = fd.readline()
-    return lines
+    return _read_first_line("helm_package_successful.txt")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helm_package_failed():
-    with open(DATA_DIR / "helm_package_failed.txt") as fd:
-        lines = fd.readline()
-    return lines
+    return _read_first_line("helm_package_failed.txt")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def helm_list_json():
-    return json.loads((DATA_DIR / "helm_list.json").read_text())
+    return _load_json("helm_list.json")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def oc_get_is_ruby_json():
-    return json.loads((DATA_DIR / "oc_get_is_ruby.json").read_text())
+    return _load_json("oc_get_is_ruby.json")
 
 
-@pytest.fixture()
-def oc_build_pod_not_finished_json():
-    return json.loads((DATA_DIR / "oc_build_pod_not_finished.json").read_text())
-
-
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def oc_build_pod_finished_json():
-    return json.loads((DATA_DIR / "oc_build_pod_finished.json").read_text())
+    return _load_json("oc_build_pod_finished.json")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def oc_is_pod_running():
-    return json.loads((DATA_DIR / "oc_is_pod_running.json").read_text())
+    return _load_json("oc_is_pod_running.json")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def get_chart_yaml():
-    return yaml.safe_load((DATA_DIR / "Chart.yaml").read_text())
-
+    return _load_yaml("Chart.yaml")
 
-@pytest.fixture()
-def get_svc_ip():
-    return json.loads((DATA_DIR / "oc_get_svc.json").read_text())
 
-
-@pytest.fixture()
-def get_svc_ip_empty():
-    return json.loads((DATA_DIR / "oc_get_svc_empty.json").read_text())
+@pytest.fixture
+def fixture_data(request):
+    return _load_json(request.param)
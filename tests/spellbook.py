@@ -24,7 +24,17 @@
 """
 A book with our finest spells
 """
+import functools
+
 from pathlib import Path
 
 TESTS_DIR = Path(__file__).parent
 DATA_DIR = TESTS_DIR / "data"
+
+
+@functools.lru_cache(maxsize=None)
+def load_envs(name: str) -> str:
+    """
+    Load `env` command output stored in data/envs/<name>.txt
+    """
+    return (DATA_DIR / "envs" / f"{name}.txt").read_text()
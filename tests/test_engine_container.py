@@ -30,10 +30,12 @@ from flexmock import flexmock
 from container_ci_suite.engines.container import ContainerImage, PodmanCLIWrapper
 
 
-class TestEngineContainer:
-    def setup_method(self):
-        self.ci = ContainerImage(image_name="nodejs")
+@pytest.fixture(scope="class")
+def ci():
+    return ContainerImage(image_name="nodejs")
+
 
+class TestEngineContainer:
     @pytest.mark.parametrize(
         "inspect_output,return_value",
         [
@@ -42,7 +44,7 @@ class TestEngineContainer:
             ('[{"something": "foobar"}]', None),
         ],
     )
-    def test_get_cip(self, inspect_output, return_value):
+    def test_get_cip(self, ci, inspect_output, return_value):
         flexmock(ContainerImage).should_receive("get_cid_file").and_return("something")
         flexmock(PodmanCLIWrapper).should_receive("run_docker_command").and_return(inspect_output)
-        assert self.ci.get_cip() == return_value
+        assert ci.get_cip() == return_value
@@ -23,8 +23,7 @@
 
 import os
 
-from pathlib import Path
-import tempfile
+import pytest
 
 
 from container_ci_suite.git import Git
@@ -32,9 +31,10 @@ from container_ci_suite.git import Git
 
 class TestContainerCISuiteGit(object):
 
-    def setup_method(self):
-        self.tmpdir = tempfile.mkdtemp(suffix="ccs")
-        self.git = Git(path=Path(os.path.join(self.tmpdir, "test_git")))
+    @pytest.fixture(autouse=True)
+    def setup_git(self, tmp_path):
+        self.tmpdir = tmp_path
+        self.git = Git(path=tmp_path / "test_git")
         (self.git.path / "barfoo").touch()
 
     def test_git_init(self):
@@ -68,6 +68,3 @@ class TestContainerCISuiteGit(object):
         assert commit
         assert commit.message.strip() == "important"
         assert commit.author.name == "foo"
-
-    def tear_down(self):
-        os.rmdir(self.tmpdir)
@@ -27,16 +27,16 @@ import pytest
 from flexmock import flexmock
 
 from container_ci_suite.openshift import OpenShiftAPI
-from container_ci_suite.engines.openshift import OpenShiftOperations
 from container_ci_suite.engines.container import PodmanCLIWrapper
 from container_ci_suite import utils
 
 
+@pytest.fixture(scope="class")
+def oc_api():
+    return OpenShiftAPI(namespace="container-ci-suite-test")
+
+
 class TestOpenShiftCISuite(object):
-    def setup_method(self):
-        self.oc_api = OpenShiftAPI(namespace="container-ci-suite-test")
-        self.oc_ops = OpenShiftOperations()
-        self.oc_ops.set_namespace(namespace="container-ci-suite-test")
 
     @pytest.mark.parametrize(
         "container,dir_name,filename,branch",
@@ -51,17 +51,16 @@ class TestOpenShiftCISuite(object):
             container=container, dir=dir_name, filename=filename, branch=branch
         ) == expected_output
 
-    def test_upload_image_pull_failed(self):
-        flexmock(PodmanCLIWrapper).should_receive("docker_pull_image").and_return(False)
-        assert not self.oc_api.upload_image(source_image="foobar", tagged_image="foobar:latest")
-
-    def test_upload_image_login_failed(self):
-        flexmock(PodmanCLIWrapper).should_receive("docker_pull_image").and_return(True)
-        flexmock(OpenShiftAPI).should_receive("docker_login_to_openshift").and_return(None)
-        assert not self.oc_api.upload_image(source_image="foobar", tagged_image="foobar:latest")
-
-    def test_upload_image_success(self):
-        flexmock(PodmanCLIWrapper).should_receive("docker_pull_image").and_return(True)
-        flexmock(OpenShiftAPI).should_receive("docker_login_to_openshift").and_return("default_registry")
-        flexmock(utils).should_receive("run_command").twice()
-        assert self.oc_api.upload_image(source_image="foobar", tagged_image="foobar:latest")
+    @pytest.mark.parametrize(
+        "pull_result,registry,run_count,expected_output",
+        [
+            (False, None, 0, False),
+            (True, None, 0, False),
+            (True, "default_registry", 2, True),
+        ],
+    )
+    def test_upload_image(self, oc_api, pull_result, registry, run_count, expected_output):
+        flexmock(PodmanCLIWrapper).should_receive("docker_pull_image").and_return(pull_result)
+        flexmock(OpenShiftAPI).should_receive("docker_login_to_openshift").and_return(registry)
+        flexmock(utils).should_receive("run_command").times(run_count)
+        assert oc_api.upload_image(source_image="foobar", tagged_image="foobar:latest") == expected_output
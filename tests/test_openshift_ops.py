@@ -22,11 +22,22 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+import pytest
+
 from flexmock import flexmock
 
 from container_ci_suite.engines.openshift import OpenShiftOperations
 
 
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """
+    Polling loops in the library wait between attempts, tests only count the attempts.
+    """
+    monkeypatch.setattr(time, "sleep", lambda *args: None)
+
+
 class TestOpenShiftOpsSuite(object):
     def setup_method(self):
         self.oc_ops = OpenShiftOperations()
@@ -49,21 +60,29 @@ class TestOpenShiftOpsSuite(object):
         flexmock(OpenShiftOperations).should_receive("get_logs").and_return("something")
         assert self.oc_ops.is_pod_running(pod_name_prefix="python-311", loops=2)
 
-    def test_build_pod_not_finished(self, oc_build_pod_not_finished_json):
-        flexmock(OpenShiftOperations).should_receive("get_pod_status").and_return(oc_build_pod_not_finished_json)
-        assert not self.oc_ops.is_build_pod_finished(cycle_count=2)
-
-    def test_build_pod_finished(self, oc_build_pod_finished_json):
-        flexmock(OpenShiftOperations).should_receive("get_pod_status").and_return(oc_build_pod_finished_json)
-        assert self.oc_ops.is_build_pod_finished(cycle_count=2)
-
-    def test_get_service_ip(self, get_svc_ip):
-        flexmock(OpenShiftOperations).should_receive("oc_get_services").and_return(get_svc_ip)
-        assert self.oc_ops.get_service_ip("python-testing") == "172.30.224.217"
+    @pytest.mark.parametrize(
+        "fixture_data,expected_output",
+        [
+            ("oc_build_pod_not_finished.json", False),
+            ("oc_build_pod_finished.json", True),
+        ],
+        indirect=["fixture_data"],
+    )
+    def test_build_pod_finished(self, fixture_data, expected_output):
+        flexmock(OpenShiftOperations).should_receive("get_pod_status").and_return(fixture_data)
+        assert self.oc_ops.is_build_pod_finished(cycle_count=2) == expected_output
 
-    def test_get_service_ip_not_available(self, get_svc_ip_empty):
-        flexmock(OpenShiftOperations).should_receive("oc_get_services").and_return(get_svc_ip_empty)
-        assert self.oc_ops.get_service_ip("python-testing") is None
+    @pytest.mark.parametrize(
+        "fixture_data,expected_ip",
+        [
+            ("oc_get_svc.json", "172.30.224.217"),
+            ("oc_get_svc_empty.json", None),
+        ],
+        indirect=["fixture_data"],
+    )
+    def test_get_service_ip(self, fixture_data, expected_ip):
+        flexmock(OpenShiftOperations).should_receive("oc_get_services").and_return(fixture_data)
+        assert self.oc_ops.get_service_ip("python-testing") == expected_ip
 
     def test_get_pod_status(self):
         # self.oc_api.get_pod_status()
@@ -22,10 +22,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import os
+import re
 import yaml
 
 from pathlib import Path
+
 from flexmock import flexmock
 
 import pytest
@@ -38,8 +39,11 @@ from container_ci_suite.utils import (
     get_env_commands_from_s2i_args,
 )
 from container_ci_suite import utils
+from container_ci_suite.constants import CA_FILE_PATH
+from tests.spellbook import load_envs
+
 
-from tests.conftest import create_ca_file, delete_ca_file
+ENV_FILTER = "^X_SCLS=|/opt/rh|/opt/app-root"
 
 
 class TestContainerCISuiteUtils(object):
@@ -57,22 +61,20 @@ class TestContainerCISuiteUtils(object):
         )
         assert name == expected_str
 
-    def test_get_npm_variables_no_ca_file(self):
-        assert get_npm_variables() == ""
-
-    def test_get_mount_ca_file_no_ca_file(self):
-        assert get_mount_ca_file() == ""
+    @pytest.mark.parametrize(
+        "function",
+        [get_npm_variables, get_mount_ca_file],
+        ids=["get_npm_variables", "get_mount_ca_file"],
+    )
+    def test_no_ca_file(self, function, monkeypatch):
+        monkeypatch.delenv("NPM_REGISTRY", raising=False)
+        assert function() == ""
 
-    def test_get_npm_variables(self):
-        create_ca_file()
-        flexmock(utils).should_receive("get_full_ca_file_path").and_return(Path("/tmp/CA_FILE_PATH"))
+    def test_get_npm_variables(self, ca_file):
         assert get_npm_variables() == f"-e NPM_MIRROR=foobar {get_mount_ca_file()}"
-        delete_ca_file()
 
-    def test_get_mount_ca_file(self):
-        create_ca_file()
-        assert get_mount_ca_file() == f"{get_mount_ca_file()}"
-        delete_ca_file()
+    def test_get_mount_ca_file(self, ca_file):
+        assert get_mount_ca_file() == f"-v {CA_FILE_PATH}:{CA_FILE_PATH}:Z"
 
     @pytest.mark.parametrize(
         "s2i_args,expected_output",
@@ -85,10 +87,8 @@ class TestContainerCISuiteUtils(object):
         ],
     )
     def test_mount_point(self, s2i_args, expected_output):
-        create_ca_file()
         ret_value = get_mount_options_from_s2i_args(s2i_args=s2i_args)
         assert ret_value == expected_output
-        delete_ca_file()
 
     @pytest.mark.parametrize(
         "s2i_args,expected_output",
@@ -105,6 +105,34 @@ class TestContainerCISuiteUtils(object):
     def test_get_env_from_s2i_args(self, s2i_args, expected_output):
         assert get_env_commands_from_s2i_args(s2i_args=s2i_args) == expected_output
 
+    @pytest.mark.parametrize(
+        "loop_envs,check_envs,expected_output",
+        [
+            ("run_envs", "exec_envs", True),
+            ("run_envs", "exec_envs_no_home", False),
+            ("run_envs", "exec_envs_path_not_set", False),
+        ],
+    )
+    def test_check_envs_set(self, loop_envs, check_envs, expected_output):
+        assert utils.check_envs_set(
+            env_filter=ENV_FILTER, check_envs=load_envs(check_envs), loop_envs=load_envs(loop_envs)
+        ) == expected_output
+
+    @pytest.mark.parametrize(
+        "env_filter,text",
+        [
+            (ENV_FILTER, "X_SCLS=nodejs"),
+            (ENV_FILTER, "PATH=/opt/app-root/src/node_modules/.bin"),
+            (ENV_FILTER, "PATH=/usr/bin"),
+            (ENV_FILTER, "FOO=X_SCLS="),
+            ("opt/(rh|app)", "PATH=/opt/app-root/bin"),
+            ("opt/(rh|app)", "PATH=/opt/rh"),
+        ],
+    )
+    def test_get_env_filter_matcher(self, env_filter, text):
+        matches = utils.get_env_filter_matcher(env_filter)
+        assert bool(matches(text)) == bool(re.search(env_filter, text))
+
     @pytest.mark.parametrize(
         "image_name,version,os_name,expected_output",
         [
@@ -114,10 +142,10 @@ class TestContainerCISuiteUtils(object):
             ("rhel8/httpd-24:1", "2.4", "rhel8", True),
         ],
     )
-    def test_check_variables(self, image_name, version, os_name, expected_output):
-        os.environ["IMAGE_NAME"] = image_name
-        os.environ["VERSION"] = version
-        os.environ["OS"] = os_name
+    def test_check_variables(self, image_name, version, os_name, expected_output, monkeypatch):
+        monkeypatch.setenv("IMAGE_NAME", image_name)
+        monkeypatch.setenv("VERSION", version)
+        monkeypatch.setenv("OS", os_name)
         assert utils.check_variables() == expected_output
 
     @pytest.mark.parametrize(
@@ -169,16 +197,14 @@ class TestContainerCISuiteUtils(object):
             }
         }
         tenant_yaml = utils.save_tenant_namespace_yaml(project_name="123456")
-        with open(tenant_yaml) as fd:
-            yaml_load = yaml.safe_load(fd.read())
+        yaml_load = yaml.safe_load(Path(tenant_yaml).read_text())
         assert yaml_load
         assert yaml_load["metadata"]["name"] == "123456"
         assert yaml_load == expected_yaml
 
     def test_tenantnegress_yaml(self):
         tenant_yaml = utils.save_tenant_egress_yaml(project_name="123456")
-        with open(tenant_yaml) as fd:
-            yaml_load = yaml.safe_load(fd.read())
+        yaml_load = yaml.safe_load(Path(tenant_yaml).read_text())
         assert yaml_load
         assert yaml_load["metadata"]["namespace"] == "core-services-ocp--123456"
         assert yaml_load["spec"]["egress"][0]["to"]["dnsName"] == "github.com"